@@ -1,12 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import random
-from collections import OrderedDict
+import re
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter, truediv
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import json
 
+try:
+    import orjson  # Optional C encoder for faster configuration save/load
+except ImportError:
+    orjson = None
+
 # Constants
 MEMORY_SIZE = 100  # Total memory size
 BLOCK_HEIGHT = 30  # Increased height for better visibility
@@ -14,8 +25,92 @@ BLOCK_WIDTH = 3    # Scaling factor for block visualization
 MAX_MEMORY_SIZE = 1000  # Maximum allowed memory size
 PAGE_SIZE = 10  # Default page size
 MAX_PAGES = 10  # Maximum number of pages in physical memory
+HISTORY_LENGTH = 4096  # Maximum samples kept in each metrics history
+TLB_SIZE = 64  # Entries in the software TLB (must be a power of two)
+
+# Data each visualization mode draws; blocks always count because the
+# process list is refreshed with every redraw
+MODE_DEPENDENCIES = {
+    "dynamic": ("dynamic",),
+    "paging": ("dynamic", "paging"),
+    "segmentation": ("dynamic", "paging", "segmentation"),
+}
+
+# Pastel colors handed out to processes by ID, shuffled once so
+# neighbouring process IDs get visibly different colors
+_PALETTE = [
+    f'#{r:02x}{g:02x}{b:02x}'
+    for r in range(180, 256, 16)
+    for g in range(180, 256, 16)
+    for b in range(180, 256, 16)
+]
+random.Random(0).shuffle(_PALETTE)
+
+_PID_RE = re.compile(r"P(\d+)")  # Displayed process ID, e.g. P3
+_SEG_NAME_RE = re.compile(r"\w*[^\W_]\w*")  # Letters, numbers and underscores
+
+def pid_str(process_id):
+    """Format an integer process ID for display, e.g. 3 becomes P3"""
+    return f"P{process_id}"
+
+def parse_pid(text):
+    """Parse a displayed process ID such as P3 back into its integer form"""
+    match = _PID_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid process ID: {text}")
+    return int(match.group(1))
+
+# Canvas labels are memoized on the fields they show, so redraws of
+# unchanged elements reuse the same strings instead of reformatting them
+@lru_cache(maxsize=4096)
+def block_label(status, process_id, size):
+    """Get the label for a memory block"""
+    if status == "free":
+        return f"Free\n{size} units"
+    return f"{pid_str(process_id)}\n{size} units"
+
+@lru_cache(maxsize=4096)
+def _page_entry_style(page_number, is_valid, frame_number):
+    if is_valid:
+        return "light blue", f"Page {page_number}\nFrame {frame_number}"
+    return "pink", f"Page {page_number}\nNot in Memory"
+
+def page_entry_style(page):
+    """Get the fill color and label for a page table entry"""
+    return _page_entry_style(page.page_number, page.is_valid, page.frame_number)
+
+@lru_cache(maxsize=4096)
+def frame_label(process_id, page_number):
+    """Get the label for an occupied physical frame"""
+    return f"{pid_str(process_id)} P{page_number}"
+
+@lru_cache(maxsize=1024)
+def segment_label(name, process_id, size):
+    """Get the label for a segment"""
+    return f"Segment: {name}\nProcess: {pid_str(process_id)}\nSize: {size}"
+
+def _json_default(obj):
+    """Serialize history deques and arrays when saving a configuration"""
+    if isinstance(obj, (deque, array)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json(obj, f):
+    """Write obj as indented JSON to a binary file, using orjson when installed"""
+    if orjson is not None:
+        f.write(orjson.dumps(obj, default=_json_default,
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        f.write(json.dumps(obj, indent=4, default=_json_default).encode())
+
+def load_json(f):
+    """Read JSON from a binary file, using orjson when installed"""
+    data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 class MemoryBlock:
+    __slots__ = ("start", "size", "status", "process_id", "block_id")
+
     def __init__(self, start, size, status="free", process_id=None, block_id=None):
         self.start = start
         self.size = size
@@ -24,6 +119,8 @@ class MemoryBlock:
         self.block_id = block_id  # Unique identifier for each block
 
 class Page:
+    __slots__ = ("page_number", "size", "process_id", "is_valid", "last_access_time", "frame_number")
+
     def __init__(self, page_number, size, process_id=None, is_valid=False):
         self.page_number = page_number
         self.size = size
@@ -33,6 +130,8 @@ class Page:
         self.frame_number = None
 
 class Segment:
+    __slots__ = ("start", "size", "process_id", "name", "pages")
+
     def __init__(self, start, size, process_id=None, name=None):
         self.start = start
         self.size = size
@@ -43,11 +142,18 @@ class Segment:
 class MemoryManager:
     def __init__(self):
         self.memory = [MemoryBlock(0, MEMORY_SIZE, "free")]
+        self._free_by_size = []  # Sorted (size, start) keys of free blocks
+        self._free_by_addr = []  # Sorted start addresses of free blocks
+        self._free_blocks = {}   # Start address -> free MemoryBlock
+        self._free_total = 0     # Total size of all free blocks
+        self._allocated_total = 0  # Total size of all allocated blocks
+        self._blocks_by_pid = defaultdict(list)  # Process ID -> allocated blocks
+        self._block_pool = []  # Discarded MemoryBlocks kept for reuse
         self.algorithm = "first_fit"
         self.process_counter = 1
         self.block_counter = 1  # Counter for unique block IDs
         self.process_colors = {}
-        self.last_allocated_index = 0
+        self.last_allocated_start = 0  # Address where next_fit resumes its search
         self.algorithm_stats = {
             "first_fit": {"allocations": 0, "failures": 0},
             "best_fit": {"allocations": 0, "failures": 0},
@@ -59,14 +165,20 @@ class MemoryManager:
         self.page_size = PAGE_SIZE
         self.max_pages = MAX_PAGES
         self.page_table = {}  # Process ID -> List of Pages
-        self.frame_table = {}  # Frame number -> Page
+        self.frame_table = [None] * self.max_pages  # Frame number -> Page, None if free
+        self._free_frames = []  # Stack of unused frame numbers, lowest on top
         self.page_faults = 0
         self.page_hits = 0
         self.replacement_algorithm = "FIFO"  # or "LRU"
-        self.page_queue = []  # For FIFO
-        self.page_access_times = {}  # For LRU
+        self.page_queue = deque()  # For FIFO
+        self.lru = OrderedDict()  # For LRU - frame -> page, least recently used first
         self.page_loaded_times = {}  # For FIFO - track when each page was loaded
-        self.page_references = []  # For LRU - track page reference sequence
+        self._lru_ref_count = 0  # For LRU - length of the page reference sequence
+        self._tick = 0  # Logical clock for page load/access ordering
+        # Software TLB: (process_id, page_number) -> resident page, tagged with
+        # the page table version so any paging change invalidates every entry
+        self._page_table_version = 0
+        self._tlb = [(None, None, None, -1)] * TLB_SIZE
         
         # Segmentation system
         self.segments = []
@@ -74,17 +186,17 @@ class MemoryManager:
         
         # Performance metrics
         self.performance_metrics = {
-            "memory_usage": [],  # Track memory usage over time
+            "memory_usage": deque(maxlen=HISTORY_LENGTH),  # Track memory usage over time
             "peak_memory": 0,    # Peak memory usage
-            "allocation_times": [],  # Track allocation operation times
-            "deallocation_times": [],  # Track deallocation operation times
-            "page_fault_history": [],  # Track page fault occurrences
-            "page_hit_history": [],    # Track page hit occurrences
+            "allocation_times": deque(maxlen=HISTORY_LENGTH),  # Track allocation operation times
+            "deallocation_times": deque(maxlen=HISTORY_LENGTH),  # Track deallocation operation times
+            "page_fault_history": deque(maxlen=HISTORY_LENGTH),  # Track page fault occurrences
+            "page_hit_history": deque(maxlen=HISTORY_LENGTH),    # Track page hit occurrences
             "algorithm_performance": {  # Track performance of each algorithm
-                "first_fit": {"avg_time": 0, "success_rate": 0},
-                "best_fit": {"avg_time": 0, "success_rate": 0},
-                "worst_fit": {"avg_time": 0, "success_rate": 0},
-                "next_fit": {"avg_time": 0, "success_rate": 0}
+                "first_fit": {"avg_time": 0},
+                "best_fit": {"avg_time": 0},
+                "worst_fit": {"avg_time": 0},
+                "next_fit": {"avg_time": 0}
             }
         }
         
@@ -95,79 +207,161 @@ class MemoryManager:
             "cpu_utilization": [],         # Track CPU utilization
             "scheduling_history": []       # Historical scheduling data
         }
+        self._wait_sum = 0.0   # Total waiting time at the last metrics update
+        self._wait_count = 0   # Processes included in _wait_sum
+        
+        # Fragmentation metrics
+        self.fragmentation_metrics = {
+            "external_fragmentation": [],  # External fragmentation per analysis
+            "internal_fragmentation": [],  # Internal fragmentation per analysis
+            "total_wasted_space": 0,       # Wasted space at the last analysis
+            "fragmentation_history": {     # Historical fragmentation data, one array per column
+                "time": array("d"),
+                "external": array("d"),
+                "internal": array("d"),
+                "total_wasted": array("d")
+            }
+        }
+        
+        # Result dicts reused by the stats getters; callers must not mutate them
+        self._paging_stats = {}
+        self._perf_stats = {
+            "page_management": {},
+            "algorithm_performance": {},
+            "operation_times": {}
+        }
+        
+        # Change counters for the data each visualization mode draws, so the
+        # UI can tell whether a mode needs redrawing without comparing content
+        self.mode_versions = {"dynamic": 0, "paging": 0, "segmentation": 0}
+        
+        # Build lookup indexes over the initial tables
+        self.rebuild_index()
 
     def get_process_color(self, process_id):
-        """Get or generate a color for a process"""
-        if process_id not in self.process_colors:
-            # Generate a pastel color
-            r = random.randint(180, 255)
-            g = random.randint(180, 255)
-            b = random.randint(180, 255)
-            self.process_colors[process_id] = f'#{r:02x}{g:02x}{b:02x}'
-        return self.process_colors[process_id]
+        """Get or assign a color for a process"""
+        color = self.process_colors.get(process_id)
+        if color is None:
+            color = self.process_colors[process_id] = _PALETTE[process_id % len(_PALETTE)]
+        return color
+
+    def rebuild_index(self):
+        """Rebuild lookup indexes after self.memory or frame_table is replaced"""
+        # _index_of and split_block rely on self.memory being ordered by address
+        self.memory.sort(key=attrgetter("start"))
+        
+        self._blocks_by_pid = defaultdict(list)
+        self._allocated_total = 0
+        for block in self.memory:
+            if block.status == "allocated":
+                self._blocks_by_pid[block.process_id].append(block)
+                self._allocated_total += block.size
+        self._free_blocks = {
+            block.start: block for block in self.memory
+            if block.status == "free"
+        }
+        self._free_by_addr = sorted(self._free_blocks)
+        self._free_by_size = sorted(
+            (block.size, block.start) for block in self._free_blocks.values()
+        )
+        self._free_total = sum(size for size, _ in self._free_by_size)
+        self._reset_free_frames()
+        
+        # Coalesce adjacent free blocks (e.g. from a loaded configuration) so
+        # the address-ordered free list never holds two touching free blocks
+        self.merge_free_blocks()
+        for mode in self.mode_versions:
+            self._mark_changed(mode)
+
+    def _mark_changed(self, mode):
+        """Record a change to the data drawn by a visualization mode"""
+        self.mode_versions[mode] += 1
+
+    def _add_free(self, block):
+        """Add a free block to the size and address indexes"""
+        insort(self._free_by_size, (block.size, block.start))
+        insort(self._free_by_addr, block.start)
+        self._free_blocks[block.start] = block
+        self._free_total += block.size
+
+    def _remove_free(self, block):
+        """Remove a free block from the size and address indexes"""
+        del self._free_by_size[bisect_left(self._free_by_size, (block.size, block.start))]
+        del self._free_by_addr[bisect_left(self._free_by_addr, block.start)]
+        del self._free_blocks[block.start]
+        self._free_total -= block.size
+
+    def _new_block(self, start, size):
+        """Get a free block from the pool, or create one if the pool is empty"""
+        if not self._block_pool:
+            return MemoryBlock(start, size, "free")
+        block = self._block_pool.pop()
+        block.start = start
+        block.size = size
+        block.status = "free"
+        block.process_id = None
+        block.block_id = None
+        return block
+
+    def _index_of(self, start):
+        """Binary search self.memory (ordered by address) for a block start"""
+        lo, hi = 0, len(self.memory)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.memory[mid].start < start:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
 
     def reset(self):
         """Reset memory to initial state"""
         # Reset dynamic allocation
-        self.memory = [MemoryBlock(0, MEMORY_SIZE, "free")]
-        self.process_counter = 1
-        self.block_counter = 1
-        self.process_colors.clear()
-        self.last_allocated_index = 0
-        self.algorithm_stats = {
-            "first_fit": {"allocations": 0, "failures": 0},
-            "best_fit": {"allocations": 0, "failures": 0},
-            "worst_fit": {"allocations": 0, "failures": 0},
-            "next_fit": {"allocations": 0, "failures": 0}
-        }
+        self.reset_dynamic()
         
         # Reset paging system
         self.page_size = PAGE_SIZE
         self.max_pages = MAX_PAGES
-        self.page_table.clear()
-        self.frame_table.clear()
-        self.page_queue.clear()
-        self.page_access_times.clear()
-        self.page_loaded_times.clear()
-        self.page_references.clear()
-        self.page_faults = 0
-        self.page_hits = 0
+        self.reset_paging()
 
     def reset_paging(self):
         """Reset paging system"""
         self.page_table.clear()
-        self.frame_table.clear()
+        self.frame_table = [None] * self.max_pages
+        self._reset_free_frames()
         self.page_queue.clear()
-        self.page_access_times.clear()
+        self.lru.clear()
         self.page_loaded_times.clear()
-        self.page_references.clear()
+        self._lru_ref_count = 0
         self.page_faults = 0
         self.page_hits = 0
+        self._invalidate_tlb()
 
     def reset_segmentation(self):
         """Reset segmentation system"""
         self.segments.clear()
         self.segment_table.clear()
+        self._mark_changed("segmentation")
         # Also reset paging since segments use paging
         self.reset_paging()
 
     def reset_dynamic(self):
         """Reset dynamic allocation system"""
-        self.memory = [MemoryBlock(0, MEMORY_SIZE, "free")]
+        # Recycle the old blocks instead of leaving them to the garbage collector
+        self._block_pool.extend(self.memory)
+        self.memory = [self._new_block(0, MEMORY_SIZE)]
+        self.rebuild_index()
         self.process_counter = 1
         self.block_counter = 1
         self.process_colors.clear()
-        self.last_allocated_index = 0
-        self.algorithm_stats = {
-            "first_fit": {"allocations": 0, "failures": 0},
-            "best_fit": {"allocations": 0, "failures": 0},
-            "worst_fit": {"allocations": 0, "failures": 0},
-            "next_fit": {"allocations": 0, "failures": 0}
-        }
+        self.last_allocated_start = 0
+        for stats in self.algorithm_stats.values():
+            stats["allocations"] = 0
+            stats["failures"] = 0
 
     def allocate_memory(self, size):
         """Allocate memory with current algorithm"""
-        process_id = f"P{self.process_counter}"
+        process_id = self.process_counter
         self.process_counter += 1
         
         success = False
@@ -192,127 +386,191 @@ class MemoryManager:
 
     def first_fit(self, size, process_id):
         """First-fit allocation strategy"""
-        for block in self.memory:
-            if block.status == "free" and block.size >= size:
-                self.split_block(block, size, process_id)
+        # Walk only the free blocks, in address order
+        for start in self._free_by_addr:
+            block = self._free_blocks[start]
+            if block.size >= size:
+                self.split_block(block, self._index_of(start), size, process_id)
                 return True
         return False
 
     def best_fit(self, size, process_id):
         """Best-fit allocation strategy"""
-        best_block = None
-        for block in self.memory:
-            if block.status == "free" and block.size >= size:
-                if best_block is None or block.size < best_block.size:
-                    best_block = block
-        if best_block:
-            self.split_block(best_block, size, process_id)
-            return True
-        return False
+        # Smallest free block that fits; ties go to the lowest address
+        i = bisect_left(self._free_by_size, (size, -1))
+        if i == len(self._free_by_size):
+            return False
+        start = self._free_by_size[i][1]
+        self.split_block(self._free_blocks[start], self._index_of(start), size, process_id)
+        return True
 
     def worst_fit(self, size, process_id):
         """Worst-fit allocation strategy"""
-        worst_block = None
-        for block in self.memory:
-            if block.status == "free" and block.size >= size:
-                if worst_block is None or block.size > worst_block.size:
-                    worst_block = block
-        if worst_block:
-            self.split_block(worst_block, size, process_id)
-            return True
-        return False
+        if not self._free_by_size or self._free_by_size[-1][0] < size:
+            return False
+        # Largest free block; ties go to the lowest address
+        largest = self._free_by_size[-1][0]
+        i = bisect_left(self._free_by_size, (largest, -1))
+        start = self._free_by_size[i][1]
+        self.split_block(self._free_blocks[start], self._index_of(start), size, process_id)
+        return True
 
     def next_fit(self, size, process_id):
         """Next-fit allocation strategy"""
-        start_index = self.last_allocated_index
-        current_index = start_index
-        
-        # Search from last allocated position
-        while True:
-            block = self.memory[current_index]
-            if block.status == "free" and block.size >= size:
-                self.split_block(block, size, process_id)
-                self.last_allocated_index = current_index
+        # Search the free list from the last allocated address, wrapping once
+        free = self._free_by_addr
+        count = len(free)
+        first = bisect_left(free, self.last_allocated_start)
+        for offset in range(count):
+            start = free[(first + offset) % count]
+            block = self._free_blocks[start]
+            if block.size >= size:
+                self.split_block(block, self._index_of(start), size, process_id)
+                self.last_allocated_start = start
                 return True
-            
-            current_index = (current_index + 1) % len(self.memory)
-            if current_index == start_index:
-                break
         
         return False
 
-    def split_block(self, block, size, process_id):
-        """Split memory block when allocating"""
-        if block.size > size:
-            new_block = MemoryBlock(
-                block.start + size,
-                block.size - size,
-                "free"
-            )
-            self.memory.insert(self.memory.index(block) + 1, new_block)
+    def split_block(self, block, index, size, process_id):
+        """Split the block at self.memory[index] when allocating"""
+        self._remove_free(block)
+        if block.size != size:
+            # Only a partial fit splits off a free remainder; exact fits
+            # reuse the block as-is with no insert into self.memory
+            new_block = self._new_block(block.start + size, block.size - size)
+            self.memory.insert(index + 1, new_block)
+            self._add_free(new_block)
+            block.size = size
         
-        block.size = size
         block.status = "allocated"
         block.process_id = process_id
         block.block_id = f"B{self.block_counter}"
         self.block_counter += 1
+        self._blocks_by_pid[process_id].append(block)
+        self._allocated_total += size
+        self._mark_changed("dynamic")
 
     def deallocate_memory(self, process_id, block_id=None):
         """Deallocate memory blocks"""
-        deallocated = False
+        blocks = self._blocks_by_pid.get(process_id)
+        if not blocks:
+            return False
         
-        for block in self.memory:
-            if block.process_id == process_id:
-                if block_id is None:
-                    block.status = "free"
-                    block.process_id = None
-                    block.block_id = None
-                    deallocated = True
-                elif block.block_id == block_id:
-                    block.status = "free"
-                    block.process_id = None
-                    block.block_id = None
-                    deallocated = True
-                    break
-        
-        if deallocated:
-            self.merge_free_blocks()
-        
-        return deallocated
+        if block_id is None:
+            freed = blocks
+            del self._blocks_by_pid[process_id]
+        else:
+            freed = [block for block in blocks if block.block_id == block_id][:1]
+            if not freed:
+                return False
+            blocks.remove(freed[0])
+            if not blocks:
+                del self._blocks_by_pid[process_id]
+        
+        for block in freed:
+            self._allocated_total -= block.size
+            block.status = "free"
+            block.process_id = None
+            block.block_id = None
+            self._add_free(block)
+            # Only the freed block's two neighbours can need merging
+            self._merge_around(self._index_of(block.start))
+        
+        self._mark_changed("dynamic")
+        return True
 
     def merge_free_blocks(self):
         """Combine adjacent free blocks"""
         i = 0
         while i < len(self.memory) - 1:
-            current = self.memory[i]
-            next_block = self.memory[i + 1]
-            
-            if current.status == "free" and next_block.status == "free":
-                current.size += next_block.size
-                del self.memory[i + 1]
+            current, next_block = self.memory[i], self.memory[i + 1]
+            if (current.status == "free" and next_block.status == "free"
+                    and current.start + current.size == next_block.start):
+                self._absorb_next(i)
             else:
                 i += 1
+        self._mark_changed("dynamic")
+
+    def _merge_around(self, index):
+        """Combine the free block at self.memory[index] with free neighbours"""
+        if index + 1 < len(self.memory) and self.memory[index + 1].status == "free":
+            self._absorb_next(index)
+        if index > 0 and self.memory[index - 1].status == "free":
+            self._absorb_next(index - 1)
+
+    def _absorb_next(self, index):
+        """Merge the free block after self.memory[index] into it"""
+        current = self.memory[index]
+        next_block = self.memory[index + 1]
+        self._remove_free(current)
+        self._remove_free(next_block)
+        current.size += next_block.size
+        self._add_free(current)
+        del self.memory[index + 1]
+        self._block_pool.append(next_block)
 
     def get_algorithm_stats(self):
         """Get statistics for all algorithms"""
         return self.algorithm_stats
 
+    def get_success_rate(self, algorithm):
+        """Get the fraction of successful allocations for an algorithm"""
+        stats = self.algorithm_stats[algorithm]
+        total_attempts = stats["allocations"] + stats["failures"]
+        return stats["allocations"] / total_attempts if total_attempts > 0 else 0
+
     def get_process_blocks(self, process_id):
         """Get all blocks belonging to a process"""
-        return [block for block in self.memory if block.process_id == process_id]
+        return list(self._blocks_by_pid.get(process_id, ()))
 
     def set_page_size(self, size):
         """Set the page size for paging system"""
         self.page_size = size
         self.reset_paging()
 
+    def set_max_pages(self, max_pages):
+        """Set the number of physical frames for paging system"""
+        self.max_pages = max_pages
+        self.reset_paging()
+
     def set_replacement_algorithm(self, algorithm):
         """Set the page replacement algorithm"""
         self.replacement_algorithm = algorithm
-        self.page_queue = []
-        self.page_access_times = {}
-        self.page_loaded_times = {}
-        self.page_references = []
+        
+        # Refill both replacement queues from the resident frames in load
+        # order, so the new algorithm always has a victim once frames run out
+        resident = sorted(
+            self.get_resident_frames(),
+            key=lambda item: (item[1].last_access_time or 0, item[0])
+        )
+        self.page_queue = deque(frame_num for frame_num, _ in resident)
+        self.lru = OrderedDict(resident)
+        self.page_loaded_times = {
+            frame_num: page.last_access_time for frame_num, page in resident
+        }
+        self._lru_ref_count = 0
+
+    def get_resident_frames(self):
+        """Get (frame number, page) pairs for every occupied frame"""
+        return [(frame_num, page) for frame_num, page in enumerate(self.frame_table)
+                if page is not None]
+
+    def _reset_free_frames(self):
+        """Refill the free frame stack with every frame not in frame_table"""
+        self._free_frames = [
+            frame_num for frame_num in range(self.max_pages - 1, -1, -1)
+            if self.frame_table[frame_num] is None
+        ]
+
+    def _invalidate_tlb(self):
+        """Invalidate all software TLB entries after a paging change"""
+        self._page_table_version += 1
+        self._mark_changed("paging")
+
+    def _next_tick(self):
+        """Return the next value of the logical page clock"""
+        self._tick += 1
+        return self._tick
 
     def allocate_pages(self, process_id, size):
         """Allocate pages for a process"""
@@ -324,38 +582,39 @@ class MemoryManager:
             pages.append(page)
             
             # Try to allocate a frame
-            if len(self.frame_table) < self.max_pages:
-                frame_num = len(self.frame_table)
+            if self._free_frames:
+                frame_num = self._free_frames.pop()
                 self.frame_table[frame_num] = page
                 page.frame_number = frame_num
                 page.is_valid = True
-                page.last_access_time = datetime.now()
-                self.page_loaded_times[frame_num] = datetime.now()
+                page.last_access_time = self.page_loaded_times[frame_num] = self._next_tick()
                 self.page_queue.append(frame_num)
+                self.lru[frame_num] = page
             else:
                 # Need page replacement
                 self.handle_page_fault(page)
         
         self.page_table[process_id] = pages
+        self._invalidate_tlb()
         return pages
 
     def handle_page_fault(self, new_page):
         """Handle page fault using selected replacement algorithm"""
         self.page_faults += 1
+        self._invalidate_tlb()
         
         if self.replacement_algorithm == "FIFO":
             # If we have free frames
-            if len(self.frame_table) < self.max_pages:
-                frame_num = len(self.frame_table)
+            if self._free_frames:
+                frame_num = self._free_frames.pop()
                 self.frame_table[frame_num] = new_page
                 new_page.frame_number = frame_num
                 new_page.is_valid = True
-                new_page.last_access_time = datetime.now()
-                self.page_loaded_times[frame_num] = datetime.now()
+                new_page.last_access_time = self.page_loaded_times[frame_num] = self._next_tick()
                 self.page_queue.append(frame_num)
             else:
                 # Find the oldest page (first in queue)
-                victim_frame = self.page_queue.pop(0)
+                victim_frame = self.page_queue.popleft()
                 victim_page = self.frame_table[victim_frame]
                 victim_page.is_valid = False
                 
@@ -363,23 +622,22 @@ class MemoryManager:
                 self.frame_table[victim_frame] = new_page
                 new_page.frame_number = victim_frame
                 new_page.is_valid = True
-                new_page.last_access_time = datetime.now()
-                self.page_loaded_times[victim_frame] = datetime.now()
+                new_page.last_access_time = self.page_loaded_times[victim_frame] = self._next_tick()
                 self.page_queue.append(victim_frame)
             
         elif self.replacement_algorithm == "LRU":
             # If we have free frames
-            if len(self.frame_table) < self.max_pages:
-                frame_num = len(self.frame_table)
+            if self._free_frames:
+                frame_num = self._free_frames.pop()
                 self.frame_table[frame_num] = new_page
                 new_page.frame_number = frame_num
                 new_page.is_valid = True
-                new_page.last_access_time = datetime.now()
-                self.page_access_times[frame_num] = datetime.now()
-                self.page_references.append(frame_num)
+                new_page.last_access_time = self._next_tick()
+                self.lru[frame_num] = new_page
+                self._lru_ref_count += 1
             else:
-                # Find least recently used page
-                lru_frame = min(self.page_access_times.items(), key=lambda x: x[1])[0]
+                # Evict the least recently used page (front of the OrderedDict)
+                lru_frame, _ = self.lru.popitem(last=False)
                 victim_page = self.frame_table[lru_frame]
                 victim_page.is_valid = False
                 
@@ -387,19 +645,27 @@ class MemoryManager:
                 self.frame_table[lru_frame] = new_page
                 new_page.frame_number = lru_frame
                 new_page.is_valid = True
-                new_page.last_access_time = datetime.now()
-                self.page_access_times[lru_frame] = datetime.now()
-                self.page_references.append(lru_frame)
+                new_page.last_access_time = self._next_tick()
+                self.lru[lru_frame] = new_page
+                self._lru_ref_count += 1
 
     def access_page(self, process_id, page_number):
         """Simulate page access"""
+        slot = hash((process_id, page_number)) & (TLB_SIZE - 1)
         try:
+            # Fast path: a TLB entry from the current page table version is resident
+            tlb_pid, tlb_page_number, page, version = self._tlb[slot]
+            if (version == self._page_table_version and tlb_pid == process_id
+                    and tlb_page_number == page_number):
+                self._record_hit(page)
+                return True, "Page access successful"
+            
             if process_id not in self.page_table:
                 # Check if process exists in memory but not in page table
-                process_exists = any(block.process_id == process_id for block in self.memory)
-                if process_exists:
+                blocks = self._blocks_by_pid.get(process_id)
+                if blocks:
                     # Process exists in memory but not in page table, create it
-                    size = sum(block.size for block in self.memory if block.process_id == process_id)
+                    size = sum(block.size for block in blocks)
                     self.allocate_pages(process_id, size)
                 else:
                     return False, "Process not found in memory"
@@ -408,21 +674,26 @@ class MemoryManager:
             if 0 <= page_number < len(pages):
                 page = pages[page_number]
                 if page.is_valid:
-                    self.page_hits += 1
-                    if self.replacement_algorithm == "LRU":
-                        self.page_access_times[page.frame_number] = datetime.now()
-                        if page.frame_number in self.page_references:
-                            self.page_references.remove(page.frame_number)
-                        self.page_references.append(page.frame_number)
-                    return True, "Page access successful"
+                    self._record_hit(page)
+                    message = "Page access successful"
                 else:
                     self.handle_page_fault(page)
-                    return True, "Page fault handled successfully"
+                    message = "Page fault handled successfully"
+                self._tlb[slot] = (process_id, page_number, page, self._page_table_version)
+                return True, message
             else:
-                return False, f"Invalid page number. Process {process_id} has {len(pages)} pages (0 to {len(pages)-1})"
+                return False, f"Invalid page number. Process {pid_str(process_id)} has {len(pages)} pages (0 to {len(pages)-1})"
         except Exception as e:
             return False, f"Error accessing page: {str(e)}"
 
+    def _record_hit(self, page):
+        """Count a page hit and refresh its LRU position"""
+        # Update LRU order first so a failed lookup leaves the counters untouched
+        if self.replacement_algorithm == "LRU":
+            self.lru.move_to_end(page.frame_number)
+            self._lru_ref_count += 1
+        self.page_hits += 1
+
     def create_segment(self, process_id, size, name=None):
         """Create a new segment for a process"""
         segment = Segment(0, size, process_id, name)
@@ -434,6 +705,7 @@ class MemoryManager:
         
         # Allocate pages for the segment
         segment.pages = self.allocate_pages(process_id, size)
+        self._mark_changed("segmentation")
         return segment
 
     def get_paging_stats(self):
@@ -442,46 +714,42 @@ class MemoryManager:
         fault_rate = self.page_faults / total_accesses if total_accesses > 0 else 0
         
         # Calculate additional statistics
-        stats = {
-            "page_faults": self.page_faults,
-            "page_hits": self.page_hits,
-            "fault_rate": fault_rate,
-            "total_pages": len(self.frame_table),
-            "max_pages": self.max_pages
-        }
+        stats = self._paging_stats
+        stats.clear()
+        stats["page_faults"] = self.page_faults
+        stats["page_hits"] = self.page_hits
+        stats["fault_rate"] = fault_rate
+        stats["total_pages"] = self.max_pages - len(self._free_frames)
+        stats["max_pages"] = self.max_pages
         
         if self.replacement_algorithm == "FIFO":
             stats["queue_length"] = len(self.page_queue)
-            if self.page_loaded_times:
-                oldest_page = min(self.page_loaded_times.items(), key=lambda x: x[1])[0]
+            if self.page_queue:
+                # Frames are queued in load order, so the head is the oldest
+                oldest_page = self.page_queue[0]
                 stats["oldest_page"] = f"Frame {oldest_page}"
         
         elif self.replacement_algorithm == "LRU":
-            stats["reference_sequence_length"] = len(self.page_references)
-            if self.page_access_times:
-                lru_page = min(self.page_access_times.items(), key=lambda x: x[1])[0]
+            stats["reference_sequence_length"] = self._lru_ref_count
+            if self.lru:
+                lru_page = next(iter(self.lru))
                 stats["least_recently_used"] = f"Frame {lru_page}"
         
         return stats
 
     def calculate_fragmentation(self):
         """Calculate external fragmentation percentage"""
-        free_blocks = [
-            block.size for block in self.memory 
-            if block.status == "free"
-        ]
-        
-        if not free_blocks:
+        # Both figures come straight from the free block indexes
+        if not self._free_total:
             return 0.0
             
-        largest_free_block = max(free_blocks)
-        total_free = sum(free_blocks)
-        fragmentation = (1 - (largest_free_block / total_free)) * 100
+        largest_free_block = self._free_by_size[-1][0]
+        fragmentation = (1 - (largest_free_block / self._free_total)) * 100
         return fragmentation
 
     def get_performance_metrics(self):
         """Get current performance metrics"""
-        current_usage = sum(block.size for block in self.memory if block.status == "allocated")
+        current_usage = self._allocated_total
         
         # Update metrics
         self.performance_metrics["memory_usage"].append(current_usage)
@@ -497,63 +765,50 @@ class MemoryManager:
             fault_ratio = self.page_faults / total_accesses
         else:
             hit_ratio = fault_ratio = 0
-            
-        # Calculate algorithm performance
-        for algorithm in self.algorithm_stats:
-            stats = self.algorithm_stats[algorithm]
-            total_attempts = stats["allocations"] + stats["failures"]
-            if total_attempts > 0:
-                self.performance_metrics["algorithm_performance"][algorithm]["success_rate"] = (
-                    stats["allocations"] / total_attempts
-                )
         
-        return {
-            "current_usage": current_usage,
-            "peak_memory": self.performance_metrics["peak_memory"],
-            "memory_usage_history": self.performance_metrics["memory_usage"],
-            "page_management": {
-                "hit_ratio": hit_ratio,
-                "fault_ratio": fault_ratio,
-                "total_accesses": total_accesses
-            },
-            "algorithm_performance": self.performance_metrics["algorithm_performance"],
-            "operation_times": {
-                "allocation": self.performance_metrics["allocation_times"],
-                "deallocation": self.performance_metrics["deallocation_times"]
-            }
-        }
+        result = self._perf_stats
+        result["current_usage"] = current_usage
+        result["peak_memory"] = self.performance_metrics["peak_memory"]
+        result["memory_usage_history"] = self.performance_metrics["memory_usage"]
+        
+        page_management = result["page_management"]
+        page_management["hit_ratio"] = hit_ratio
+        page_management["fault_ratio"] = fault_ratio
+        page_management["total_accesses"] = total_accesses
+        
+        algorithm_performance = result["algorithm_performance"]
+        for algorithm, perf in self.performance_metrics["algorithm_performance"].items():
+            entry = algorithm_performance.setdefault(algorithm, {})
+            entry.update(perf)
+            entry["success_rate"] = self.get_success_rate(algorithm)
+        
+        operation_times = result["operation_times"]
+        operation_times["allocation"] = self.performance_metrics["allocation_times"]
+        operation_times["deallocation"] = self.performance_metrics["deallocation_times"]
+        return result
 
     def analyze_fragmentation(self):
         """Analyze both external and internal fragmentation"""
         # Calculate external fragmentation
-        free_blocks = [block for block in self.memory if block.status == "free"]
-        total_free = sum(block.size for block in free_blocks)
-        if total_free > 0:
-            largest_free = max(block.size for block in free_blocks)
-            external_frag = (1 - (largest_free / total_free)) * 100
-        else:
-            external_frag = 0
+        external_frag = self.calculate_fragmentation()
 
-        # Calculate internal fragmentation
-        internal_frag = 0
-        total_wasted = 0
-        for block in self.memory:
-            if block.status == "allocated":
-                # Calculate wasted space within allocated blocks
-                wasted = block.size - (block.size // self.page_size) * self.page_size
-                total_wasted += wasted
-                internal_frag += (wasted / block.size) * 100
+        # Calculate internal fragmentation: the space wasted within each
+        # allocated block is its size modulo the page size
+        page_size = self.page_size
+        sizes = [block.size for blocks in self._blocks_by_pid.values() for block in blocks]
+        wasted = [size % page_size for size in sizes]
+        total_wasted = sum(wasted)
+        internal_frag = sum(map(truediv, wasted, sizes)) * 100
 
         # Update metrics
         self.fragmentation_metrics["external_fragmentation"].append(external_frag)
         self.fragmentation_metrics["internal_fragmentation"].append(internal_frag)
         self.fragmentation_metrics["total_wasted_space"] = total_wasted
-        self.fragmentation_metrics["fragmentation_history"].append({
-            "time": datetime.now(),
-            "external": external_frag,
-            "internal": internal_frag,
-            "total_wasted": total_wasted
-        })
+        history = self.fragmentation_metrics["fragmentation_history"]
+        history["time"].append(datetime.now().timestamp())
+        history["external"].append(external_frag)
+        history["internal"].append(internal_frag)
+        history["total_wasted"].append(total_wasted)
 
         return {
             "external_fragmentation": external_frag,
@@ -579,16 +834,23 @@ class MemoryManager:
     def update_scheduling_metrics(self):
         """Update process scheduling metrics"""
         current_time = datetime.now()
+        queued = set(self.scheduling_metrics["process_queue"])
         
-        # Update waiting times
+        # Update waiting times, totalling them for the average as we go
+        wait_sum = 0.0
+        wait_count = 0
         for process_id, data in self.scheduling_metrics["waiting_times"].items():
-            if process_id in self.scheduling_metrics["process_queue"]:
+            if process_id in queued:
                 wait_time = (current_time - data["start_time"]).total_seconds()
                 data["current_wait"] = wait_time
+                wait_sum += wait_time
+                wait_count += 1
+        self._wait_sum = wait_sum
+        self._wait_count = wait_count
 
         # Calculate CPU utilization (simplified)
-        active_processes = len([p for p in self.scheduling_metrics["process_queue"] 
-                              if p in self.page_table])
+        active_processes = sum(1 for p in self.scheduling_metrics["process_queue"]
+                               if p in self.page_table)
         total_processes = len(self.scheduling_metrics["process_queue"])
         cpu_util = (active_processes / total_processes * 100) if total_processes > 0 else 0
         
@@ -599,10 +861,14 @@ class MemoryManager:
         analysis = self.analyze_fragmentation()
         return {
             "current_metrics": analysis,
-            "historical_data": self.fragmentation_metrics["fragmentation_history"],
+            "historical_data": self.get_fragmentation_history(),
             "recommendations": self.generate_fragmentation_recommendations(analysis)
         }
 
+    def get_fragmentation_history(self):
+        """Get fragmentation history as column arrays keyed by metric name"""
+        return self.fragmentation_metrics["fragmentation_history"]
+
     def get_scheduling_report(self):
         """Generate a detailed scheduling report"""
         self.update_scheduling_metrics()
@@ -633,7 +899,7 @@ class MemoryManager:
         """Generate recommendations based on scheduling metrics"""
         recommendations = []
         
-        avg_wait_time = sum(data["current_wait"] for data in self.scheduling_metrics["waiting_times"].values()) / len(self.scheduling_metrics["waiting_times"]) if self.scheduling_metrics["waiting_times"] else 0
+        avg_wait_time = self._wait_sum / self._wait_count if self._wait_count else 0
         
         if avg_wait_time > 5:  # 5 seconds threshold
             recommendations.append("High process waiting times detected. Consider increasing memory size.")
@@ -694,6 +960,10 @@ class MemoryVisualizer:
         
         self.process_tree.pack(fill="x", expand=True)
         
+        # Tree rows by (process id, block id), and the values shown in each row
+        self._tree_index = {}
+        self._tree_values = {}
+        
         # Add double-click binding for block selection
         self.process_tree.bind("<Double-1>", self.on_block_select)
         
@@ -721,7 +991,36 @@ class MemoryVisualizer:
         
         # Configure scrollbars
         h_scrollbar.config(command=self.canvas.xview)
-        v_scrollbar.config(command=self.canvas.yview)
+        v_scrollbar.config(command=self._on_yview)
+        
+        # Only the visible rows are drawn, so scrolling and resizing must redraw
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        
+        # Canvas item kinds: canvas item type plus the options fixed at creation
+        self._small_font = tkfont.Font(family="Helvetica", size=8)
+        self._item_kinds = {
+            "grid": ("image", {"anchor": "nw"}),
+            "rect": ("rectangle", {}),
+            "text": ("text", {"justify": "center"}),
+            "label": ("text", {"anchor": "nw", "font": self._small_font}),
+        }
+        
+        # Canvas items persist across redraws, keyed by what they depict:
+        # (kind, element key) -> (item id, last coords, last options)
+        self._item_index = {}
+        self._seen_items = set()  # Index keys placed by the current redraw
+        self._item_pool = {kind: [] for kind in self._item_kinds}  # Hidden spare items
+        self._items_created = False  # Whether this redraw added items to the display
+        self._grid_geometry = None  # (scaled width, canvas height) of the grid image
+        self._grid_image = None  # PhotoImage holding all grid lines
+        self._page_column_cache = []  # Page table column geometry, grown on demand
+        self._segment_layout_cache = (None, None)  # (layout key, segment rows)
+        self._frame_layout_cache = (None, None)  # (layout key, frame geometry)
+        self._last_vis_sig = None  # Content drawn by the last redraw
+        self._last_view_key = None  # Mode, geometry and data versions of the last redraw
+        self._last_scrollregion = None  # Scroll region set by the last redraw
+        self._drawn_height = None  # Canvas height used by the last redraw
+        self._redraw_pending = None  # after_idle ID of a scheduled redraw
         
         # Control widgets
         ttk.Label(control_frame, text="Memory Size:").grid(row=1, column=0, padx=5)
@@ -781,6 +1080,11 @@ class MemoryVisualizer:
         self.status_bar.pack(fill="x", padx=10, pady=2)
         
         # Bind hover events
+        self._hover_blocks = []     # Blocks drawn in dynamic mode, top to bottom
+        self._block_y_offsets = array("d")  # Top y coordinate of each drawn block
+        self._block_x_ends = array("d")     # Right x coordinate of each drawn block
+        self._hover_height = BLOCK_HEIGHT   # Scaled height of the drawn blocks
+        self._last_hover_idx = None  # Block index shown in the status bar
         self.canvas.bind("<Motion>", self.on_hover)
         
         # Add zoom controls
@@ -789,6 +1093,7 @@ class MemoryVisualizer:
         
         ttk.Label(zoom_frame, text="Zoom:").pack(side="left", padx=5)
         self.zoom_var = tk.DoubleVar(value=1.0)
+        self._zoom_after_id = None  # Pending coalesced zoom redraw
         self.zoom_scale = ttk.Scale(
             zoom_frame,
             from_=0.5,
@@ -798,6 +1103,7 @@ class MemoryVisualizer:
             command=self.update_zoom
         )
         self.zoom_scale.pack(side="left", fill="x", expand=True, padx=5)
+        self.zoom_scale.bind("<ButtonRelease-1>", self._on_zoom_release)
         
         # Add zoom percentage label
         self.zoom_label = ttk.Label(zoom_frame, text="100%")
@@ -881,6 +1187,14 @@ class MemoryVisualizer:
         )
         self.access_page_button.pack(side="left", padx=5)
         
+        # Dialogs stall the event loop; turning them off reports in the status bar only
+        self.verbose_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            self.page_access_frame,
+            text="Show access dialogs",
+            variable=self.verbose_var
+        ).pack(side="left", padx=5)
+        
         # Initially hide paging and segmentation controls
         self.paging_frame.grid_remove()
         self.segmentation_frame.grid_remove()
@@ -940,7 +1254,7 @@ class MemoryVisualizer:
                         "process_id": page.process_id,
                         "size": page.size
                     }
-                    for frame_num, page in self.memory_manager.frame_table.items()
+                    for frame_num, page in self.memory_manager.get_resident_frames()
                 },
                 "segments": [
                     {
@@ -964,8 +1278,8 @@ class MemoryVisualizer:
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(config, f, indent=4)
+                with open(filename, 'wb') as f:
+                    dump_json(config, f)
                 messagebox.showinfo("Success", "Configuration saved successfully!")
                 self.status_var.set(f"Configuration saved to {filename}")
                 
@@ -982,8 +1296,8 @@ class MemoryVisualizer:
             )
             
             if filename:
-                with open(filename, 'r') as f:
-                    config = json.load(f)
+                with open(filename, 'rb') as f:
+                    config = load_json(f)
                 
                 # Reset memory manager
                 self.memory_manager.reset()
@@ -992,62 +1306,59 @@ class MemoryVisualizer:
                 self.memory_manager.page_size = config["page_size"]
                 self.memory_manager.max_pages = config["max_pages"]
                 self.memory_manager.algorithm = config["algorithm"]
-                self.memory_manager.set_replacement_algorithm(config["replacement_algorithm"])
+                
+                # Field getters fetch each record's constructor arguments in one call
+                get_block = itemgetter("start", "size", "status", "process_id", "block_id")
+                get_page = itemgetter("page_number", "size", "is_valid", "frame_number")
+                get_segment = itemgetter("start", "size", "process_id", "name")
                 
                 # Restore memory blocks
                 self.memory_manager.memory = [
-                    MemoryBlock(
-                        block["start"],
-                        block["size"],
-                        block["status"],
-                        block["process_id"],
-                        block["block_id"]
-                    )
-                    for block in config["memory_blocks"]
+                    MemoryBlock(*fields)
+                    for fields in map(get_block, config["memory_blocks"])
                 ]
                 
-                # Restore page table
-                self.memory_manager.page_table = {
-                    process_id: [
-                        Page(
-                            page["page_number"],
-                            page["size"],
-                            process_id,
-                            page["is_valid"]
-                        )
-                        for page in pages
-                    ]
-                    for process_id, pages in config["page_table"].items()
-                }
-                
-                # Restore frame table
-                self.memory_manager.frame_table = {
-                    int(frame_num): Page(
-                        page["page_number"],
-                        page["size"],
-                        page["process_id"]
-                    )
-                    for frame_num, page in config["frame_table"].items()
-                }
+                # Restore page table (JSON object keys come back as strings)
+                # and the frame table, which must hold the same Page objects
+                # so replacement and access updates reach the page table
+                page_table = {}
+                frame_table = [None] * self.memory_manager.max_pages
+                for process_id, pages in config["page_table"].items():
+                    pid = int(process_id)
+                    restored = page_table[pid] = []
+                    for page_number, size, is_valid, frame_number in map(get_page, pages):
+                        page = Page(page_number, size, pid, is_valid)
+                        if is_valid:
+                            page.frame_number = frame_number
+                            frame_table[frame_number] = page
+                        restored.append(page)
+                self.memory_manager.page_table = page_table
+                self.memory_manager.frame_table = frame_table
                 
                 # Restore segments
                 self.memory_manager.segments = [
-                    Segment(
-                        segment["start"],
-                        segment["size"],
-                        segment["process_id"],
-                        segment["name"]
-                    )
-                    for segment in config["segments"]
+                    Segment(*fields)
+                    for fields in map(get_segment, config["segments"])
                 ]
+                self.memory_manager.rebuild_index()
+                self.memory_manager.set_replacement_algorithm(config["replacement_algorithm"])
                 
-                # Restore metrics
-                self.memory_manager.performance_metrics = config["performance_metrics"]
-                self.memory_manager.fragmentation_metrics = config["fragmentation_metrics"]
+                # Restore metrics, re-bounding the history lists
+                performance_metrics = config["performance_metrics"]
+                for key, value in performance_metrics.items():
+                    if isinstance(value, list):
+                        performance_metrics[key] = deque(value, maxlen=HISTORY_LENGTH)
+                self.memory_manager.performance_metrics = performance_metrics
+                fragmentation_metrics = config["fragmentation_metrics"]
+                fragmentation_metrics["fragmentation_history"] = {
+                    column: array("d", values)
+                    for column, values in fragmentation_metrics["fragmentation_history"].items()
+                }
+                self.memory_manager.fragmentation_metrics = fragmentation_metrics
                 self.memory_manager.scheduling_metrics = config["scheduling_metrics"]
                 
                 # Update UI
-                self.update_visualization()
+                self._request_redraw()
                 messagebox.showinfo("Success", "Configuration loaded successfully!")
                 self.status_var.set(f"Configuration loaded from {filename}")
                 
@@ -1077,7 +1388,7 @@ class MemoryVisualizer:
         self.segment_name_entry.delete(0, tk.END)
         
         # Update visualization and status
-        self.update_visualization()
+        self._request_redraw()
         self.status_var.set(f"Memory reset to initial state ({mode} mode)")
 
     def on_hover(self, event):
@@ -1086,22 +1397,25 @@ class MemoryVisualizer:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
         
-        # Find the block under the cursor
-        y = 10
-        for block in self.memory_manager.memory:
-            x1, y1 = 10, y
-            x2, y2 = 10 + block.size * BLOCK_WIDTH, y + BLOCK_HEIGHT
-            
-            if (x1 <= canvas_x <= x2 and y1 <= canvas_y <= y2):
-                details = f"Start: {block.start}, Size: {block.size}, Status: {block.status}"
-                if block.process_id:
-                    details += f", Process: {block.process_id}"
-                self.status_var.set(details)
-                return
-                
-            y += BLOCK_HEIGHT + 5
+        # Find the block under the cursor from the offsets cached at draw time
+        idx = bisect_right(self._block_y_offsets, canvas_y) - 1
+        if idx >= 0 and not (canvas_y <= self._block_y_offsets[idx] + self._hover_height and
+                             10 <= canvas_x <= self._block_x_ends[idx]):
+            idx = -1
         
-        self.status_var.set("Ready")
+        # Skip the status update while the cursor stays on the same block
+        if idx == self._last_hover_idx:
+            return
+        self._last_hover_idx = idx
+        
+        if idx >= 0:
+            block = self._hover_blocks[idx]
+            details = f"Start: {block.start}, Size: {block.size}, Status: {block.status}"
+            if block.process_id is not None:
+                details += f", Process: {pid_str(block.process_id)}"
+            self.status_var.set(details)
+        else:
+            self.status_var.set("Ready")
 
     def allocate(self):
         """Handle memory allocation"""
@@ -1117,13 +1431,13 @@ class MemoryVisualizer:
             success, process_id = self.memory_manager.allocate_memory(size)
             if success:
                 self.process_entry.delete(0, tk.END)
-                self.process_entry.insert(0, process_id)
-                self.status_var.set(f"Successfully allocated {size} units to {process_id}")
+                self.process_entry.insert(0, pid_str(process_id))
+                self.status_var.set(f"Successfully allocated {size} units to {pid_str(process_id)}")
             else:
                 self.status_var.set("Failed to allocate memory - not enough contiguous space")
                 messagebox.showerror("Error", "Not enough contiguous memory")
             
-            self.update_visualization()
+            self._request_redraw()
         except ValueError:
             self.status_var.set("Error: Please enter a valid size")
             messagebox.showerror("Error", "Please enter a valid size")
@@ -1145,7 +1459,14 @@ class MemoryVisualizer:
             block_id = None
             self.status_var.set(f"Attempting to deallocate all blocks of process {process_id}")
         
-        if self.memory_manager.deallocate_memory(process_id, block_id):
+        try:
+            pid = parse_pid(process_id)
+        except ValueError:
+            self.status_var.set(f"Error: Invalid Process ID {process_id}")
+            messagebox.showerror("Error", f"Invalid Process ID '{process_id}'. Expected P1, P2, etc.")
+            return
+        
+        if self.memory_manager.deallocate_memory(pid, block_id):
             if block_id:
                 self.status_var.set(f"Successfully deallocated block {block_id} of process {process_id}")
             else:
@@ -1159,7 +1480,7 @@ class MemoryVisualizer:
                 self.status_var.set(f"Failed to deallocate - no blocks found for process {process_id}")
                 messagebox.showerror("Error", f"No allocated blocks found for process {process_id}")
         
-        self.update_visualization()
+        self._request_redraw()
 
     def update_total_memory(self):
         """Update the total memory size"""
@@ -1174,10 +1495,11 @@ class MemoryVisualizer:
             
             # Reset memory with new size
             self.memory_manager.memory = [MemoryBlock(0, new_size, "free")]
+            self.memory_manager.rebuild_index()
             self.memory_manager.process_counter = 1
             self.memory_manager.process_colors.clear()
             
-            self.update_visualization()
+            self._request_redraw()
             self.update_process_list()
             self.status_var.set(f"Memory size updated to {new_size} units")
         except ValueError:
@@ -1185,24 +1507,78 @@ class MemoryVisualizer:
 
     def update_process_list(self):
         """Update the process list display"""
-        # Clear existing items
-        for item in self.process_tree.get_children():
-            self.process_tree.delete(item)
+        tree = self.process_tree
+        old_index = self._tree_index
+        tree_values = self._tree_values
+        index = {}
+        order = []
         
-        # Add each allocated block to tree
+        # Reuse the row of each block that is still allocated, touching it only if it changed
         for block in self.memory_manager.memory:
             if block.status == "allocated":
-                self.process_tree.insert("", "end", values=(
-                    block.process_id,
+                key = (block.process_id, block.block_id)
+                values = (
+                    pid_str(block.process_id),
                     block.block_id,
                     block.size,
                     block.start
-                ))
+                )
+                item = old_index.pop(key, None)
+                if item is None:
+                    item = tree.insert("", len(order), values=values)
+                elif tree_values[item] != values:
+                    tree.item(item, values=values)
+                tree_values[item] = values
+                index[key] = item
+                order.append(item)
+        
+        # Remove rows of freed blocks in a single Tcl call
+        if old_index:
+            stale = tuple(old_index.values())
+            tree.delete(*stale)
+            for item in stale:
+                del tree_values[item]
+        self._tree_index = index
+        
+        # Rows follow memory order; blocks rarely move, so this is usually a no-op
+        if order != list(tree.get_children()):
+            for position, item in enumerate(order):
+                tree.move(item, "", position)
 
     def update_zoom(self, *args):
         """Update the visualization zoom level"""
         zoom = self.zoom_var.get()
         self.zoom_label.config(text=f"{int(zoom * 100)}%")
+        
+        # The slider fires on every pixel of movement; redraw at most once per frame
+        if self._zoom_after_id is not None:
+            self.root.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.root.after(16, self._do_zoom_redraw)
+
+    def _do_zoom_redraw(self):
+        """Redraw the canvas for the latest zoom level"""
+        self._zoom_after_id = None
+        self._request_redraw(force=True)
+
+    def _on_zoom_release(self, event):
+        """Draw the final zoom level as soon as the slider is released"""
+        if self._zoom_after_id is not None:
+            self.root.after_cancel(self._zoom_after_id)
+            self._do_zoom_redraw()
+
+    def _request_redraw(self, force=False):
+        """Schedule one redraw for when Tk is idle, coalescing repeated requests"""
+        if force:
+            if self._redraw_pending is not None:
+                self.root.after_cancel(self._redraw_pending)
+                self._redraw_pending = None
+            self.update_visualization()
+        elif self._redraw_pending is None:
+            self._redraw_pending = self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run the redraw scheduled by _request_redraw"""
+        self._redraw_pending = None
         self.update_visualization()
 
     def on_mode_change(self):
@@ -1223,7 +1599,7 @@ class MemoryVisualizer:
             self.segmentation_frame.grid_remove()
             self.page_access_frame.grid_remove()
         
-        self.update_visualization()
+        self._request_redraw()
 
     def update_paging_settings(self):
         """Update paging system settings"""
@@ -1236,11 +1612,11 @@ class MemoryVisualizer:
                 return
             
             self.memory_manager.set_page_size(page_size)
-            self.memory_manager.max_pages = max_pages
+            self.memory_manager.set_max_pages(max_pages)
             self.memory_manager.set_replacement_algorithm(self.replacement_var.get())
             
             self.status_var.set("Paging settings updated successfully")
-            self.update_visualization()
+            self._request_redraw()
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers")
 
@@ -1300,7 +1676,7 @@ class MemoryVisualizer:
                 return
             
             # Validate segment name format (only letters, numbers, and underscores)
-            if not name.replace('_', '').isalnum():
+            if not _SEG_NAME_RE.fullmatch(name):
                 messagebox.showerror(
                     "Invalid Segment Name",
                     f"The Segment Name '{name}' is invalid.\n\n"
@@ -1323,7 +1699,9 @@ class MemoryVisualizer:
                 )
                 return
             
-            if not process_id.startswith('P'):
+            try:
+                pid = parse_pid(process_id)
+            except ValueError:
                 messagebox.showerror(
                     "Invalid Process ID",
                     f"The Process ID '{process_id}' is invalid.\n\n"
@@ -1334,7 +1712,7 @@ class MemoryVisualizer:
                 return
             
             # Check if process exists
-            if process_id not in self.memory_manager.page_table:
+            if pid not in self.memory_manager.page_table:
                 messagebox.showerror(
                     "Process Not Found",
                     f"Process '{process_id}' does not exist.\n\n"
@@ -1344,8 +1722,8 @@ class MemoryVisualizer:
                 return
             
             # Check if segment name already exists for this process
-            if process_id in self.memory_manager.segment_table:
-                existing_segments = [s.name for s in self.memory_manager.segment_table[process_id]]
+            if pid in self.memory_manager.segment_table:
+                existing_segments = [s.name for s in self.memory_manager.segment_table[pid]]
                 if name in existing_segments:
                     messagebox.showerror(
                         "Duplicate Segment Name",
@@ -1355,7 +1733,7 @@ class MemoryVisualizer:
                     return
             
             # Create the segment
-            segment = self.memory_manager.create_segment(process_id, size, name)
+            segment = self.memory_manager.create_segment(pid, size, name)
             
             # Show success message with details
             messagebox.showinfo(
@@ -1368,7 +1746,7 @@ class MemoryVisualizer:
             )
             
             self.status_var.set(f"Created segment '{name}' for process {process_id}")
-            self.update_visualization()
+            self._request_redraw()
             
         except Exception as e:
             messagebox.showerror(
@@ -1404,7 +1782,9 @@ class MemoryVisualizer:
                 return
             
             # Validate process ID format
-            if not process_id.startswith('P'):
+            try:
+                pid = parse_pid(process_id)
+            except ValueError:
                 messagebox.showerror(
                     "Invalid Process ID",
                     f"The Process ID '{process_id}' is invalid.\n\n"
@@ -1437,7 +1817,7 @@ class MemoryVisualizer:
                 return
             
             # Check if process exists
-            if process_id not in self.memory_manager.page_table:
+            if pid not in self.memory_manager.page_table:
                 messagebox.showerror(
                     "Process Not Found",
                     f"Process '{process_id}' does not exist.\n\n"
@@ -1447,7 +1827,7 @@ class MemoryVisualizer:
                 return
             
             # Check if page number is valid for the process
-            process_pages = self.memory_manager.page_table[process_id]
+            process_pages = self.memory_manager.page_table[pid]
             if page_number >= len(process_pages):
                 messagebox.showerror(
                     "Invalid Page Number",
@@ -1458,31 +1838,34 @@ class MemoryVisualizer:
                 return
             
             # Attempt to access the page
-            success, message = self.memory_manager.access_page(process_id, page_number)
+            success, message = self.memory_manager.access_page(pid, page_number)
             
+            verbose = self.verbose_var.get()
             if success:
-                # Show success message with details
-                stats = self.memory_manager.get_paging_stats()
-                messagebox.showinfo(
-                    "Page Access Successful",
-                    f"Successfully accessed Page {page_number} of Process {process_id}.\n\n"
-                    f"Current Statistics:\n"
-                    f"• Page Faults: {stats['page_faults']}\n"
-                    f"• Page Hits: {stats['page_hits']}\n"
-                    f"• Fault Rate: {stats['fault_rate']:.1%}\n"
-                    f"• Pages in Memory: {stats['total_pages']}/{stats['max_pages']}"
-                )
+                if verbose:
+                    # Show success message with details
+                    stats = self.memory_manager.get_paging_stats()
+                    messagebox.showinfo(
+                        "Page Access Successful",
+                        f"Successfully accessed Page {page_number} of Process {process_id}.\n\n"
+                        f"Current Statistics:\n"
+                        f"• Page Faults: {stats['page_faults']}\n"
+                        f"• Page Hits: {stats['page_hits']}\n"
+                        f"• Fault Rate: {stats['fault_rate']:.1%}\n"
+                        f"• Pages in Memory: {stats['total_pages']}/{stats['max_pages']}"
+                    )
                 self.status_var.set(f"Accessed page {page_number} of process {process_id}")
             else:
-                messagebox.showerror(
-                    "Access Failed",
-                    f"Failed to access Page {page_number} of Process {process_id}.\n\n"
-                    "This might be due to:\n"
-                    f"• {message}\n"
-                )
-                self.status_var.set(f"Failed to access page {page_number} of process {process_id}")
+                if verbose:
+                    messagebox.showerror(
+                        "Access Failed",
+                        f"Failed to access Page {page_number} of Process {process_id}.\n\n"
+                        "This might be due to:\n"
+                        f"• {message}\n"
+                    )
+                self.status_var.set(f"Failed to access page {page_number} of process {process_id}: {message}")
             
-            self.update_visualization()
+            self._request_redraw()
             
         except Exception as e:
             messagebox.showerror(
@@ -1492,92 +1875,255 @@ class MemoryVisualizer:
             )
             self.status_var.set("Error occurred during page access")
 
+    def _place_item(self, kind, key, coords, **options):
+        """Place the canvas item of a kind for an element, touching Tk only for changes"""
+        index_key = (kind, key)
+        self._seen_items.add(index_key)
+        entry = self._item_index.get(index_key)
+        
+        if entry is not None:
+            item, last_coords, last_options = entry
+            if coords == last_coords and options == last_options:
+                return item
+            if coords != last_coords:
+                self.canvas.coords(item, *coords)
+            if options != last_options:
+                self.canvas.itemconfigure(item, **options)
+        else:
+            # Recycle a hidden spare of this kind before creating a new item
+            pool = self._item_pool[kind]
+            if pool:
+                item = pool.pop()
+                self.canvas.coords(item, *coords)
+                self.canvas.itemconfigure(item, state="normal", **options)
+            else:
+                item_type, fixed_options = self._item_kinds[kind]
+                create = getattr(self.canvas, f"create_{item_type}")
+                item = create(*coords, tags=kind, **fixed_options, **options)
+            self._items_created = True
+        self._item_index[index_key] = (item, coords, options)
+        return item
+
+    def _trim_items(self):
+        """Hide items for elements no longer drawn and restore stacking order"""
+        # Hidden items go back to their kind's pool instead of being deleted
+        stale = [key for key in self._item_index if key not in self._seen_items]
+        for key in stale:
+            item = self._item_index.pop(key)[0]
+            self.canvas.itemconfigure(item, state="hidden")
+            self._item_pool[key[0]].append(item)
+        self._seen_items.clear()
+        
+        # Created or recycled items keep arbitrary stacking, so re-layer by kind
+        if self._items_created:
+            self._items_created = False
+            self.canvas.tag_lower("grid")
+            self.canvas.tag_raise("text")
+            self.canvas.tag_raise("label")
+
+    def _page_columns(self, count):
+        """Get (x1, x2, text x) for the first count page table columns"""
+        columns = self._page_column_cache
+        for i in range(len(columns), count):
+            x1 = 10 + i * 100
+            columns.append((x1, x1 + 90, x1 + 45))
+        return columns
+
+    def _frame_layout(self, scaled_width, scaled_height):
+        """Get (key, rect, text position, label position, label) for each frame, rebuilt only when the geometry changes"""
+        max_pages = self.memory_manager.max_pages
+        layout_key = (max_pages, scaled_width, scaled_height)
+        cached_key, layout = self._frame_layout_cache
+        if cached_key == layout_key:
+            return layout
+        
+        # Frames sit in a single row at the top of the canvas
+        scaled_frame_width = (MEMORY_SIZE // max_pages) * scaled_width
+        y1 = 10
+        y2 = y1 + scaled_height
+        layout = []
+        for i in range(max_pages):
+            x1 = 10 + i * scaled_frame_width
+            x2 = x1 + scaled_frame_width
+            layout.append((
+                ("frame", i),
+                (x1, y1, x2, y2),
+                ((x1 + x2) / 2, (y1 + y2) / 2),
+                (x1 + 5, y1 + 5),
+                f"Frame {i}",
+            ))
+        self._frame_layout_cache = (layout_key, layout)
+        return layout
+
+    def _segment_layout(self, scaled_width, scaled_height):
+        """Get the segmentation rows as (y1s, y2s, rows, right, bottom), rebuilt only when segments change"""
+        layout_key = (self.memory_manager.mode_versions["segmentation"], scaled_width, scaled_height)
+        cached_key, layout = self._segment_layout_cache
+        if cached_key == layout_key:
+            return layout
+        
+        # Each row is (x2, key, segment, page); page is None for the segment itself
+        y1s, y2s, rows = [], [], []
+        right = 0
+        y = 10
+        for n, segment in enumerate(self.memory_manager.segments):
+            entries = [(segment.size, ("segment", n), None)]
+            entries.extend((page.size, ("segment_page", n, j), page)
+                           for j, page in enumerate(segment.pages))
+            for size, key, page in entries:
+                x2 = 10 + size * scaled_width
+                right = max(right, x2)
+                y1s.append(y)
+                y2s.append(y + scaled_height)
+                rows.append((x2, key, segment, page))
+                y += scaled_height + 5
+        
+        layout = (y1s, y2s, rows, right, y)
+        self._segment_layout_cache = (layout_key, layout)
+        return layout
+
+    def _draw_grid(self, scaled_width, canvas_height):
+        """Draw the grid as a single image, repainted only when its geometry changes"""
+        if (scaled_width, canvas_height) != self._grid_geometry:
+            self._grid_geometry = (scaled_width, canvas_height)
+            
+            # A new PhotoImage is transparent; paint only the line columns
+            width = round(10 + MEMORY_SIZE * scaled_width) + 1
+            height = max(canvas_height, 1)
+            self._grid_image = tk.PhotoImage(width=width, height=height)
+            for i in range(0, MEMORY_SIZE + 1, 10):
+                x = round(10 + i * scaled_width)
+                self._grid_image.put("#d3d3d3", to=(x, 0, x + 1, height))  # lightgray
+        self._place_item("grid", "grid", (0, 0), image=self._grid_image)
+
+    def _visual_signature(self, mode, zoom, canvas_height):
+        """Summarize everything the current mode draws, for skipping no-op redraws"""
+        manager = self.memory_manager
+        # The process list is refreshed with every redraw, so blocks always count
+        blocks = tuple(
+            (block.start, block.size, block.status, block.process_id)
+            for block in manager.memory
+        )
+        if mode == "paging":
+            content = (
+                tuple((page.process_id, page.page_number) if page else None
+                      for page in manager.frame_table),
+                tuple((process_id, tuple((page.page_number, page.is_valid, page.frame_number)
+                                         for page in pages))
+                      for process_id, pages in manager.page_table.items())
+            )
+        elif mode == "segmentation":
+            content = tuple(
+                (segment.name, segment.process_id, segment.size,
+                 tuple((page.page_number, page.size, page.is_valid, page.frame_number)
+                       for page in segment.pages))
+                for segment in manager.segments
+            )
+        else:
+            content = None
+        return (mode, zoom, canvas_height, blocks, content)
+
+    def _on_yview(self, *args):
+        """Scroll the canvas vertically and draw the rows that came into view"""
+        self.canvas.yview(*args)
+        self._request_redraw()
+
+    def _on_canvas_configure(self, event):
+        """Redraw after the canvas is resized"""
+        # <Configure> also fires for moves and width changes; the layout only
+        # depends on the height, so ignore everything else
+        if event.height != self._drawn_height:
+            self._request_redraw()
+
     def update_visualization(self):
         """Update the memory visualization"""
-        self.canvas.delete("all")
         y = 10
         zoom = self.zoom_var.get()
+        mode = self.mode_var.get()
+        canvas_height = self.canvas.winfo_height()
+        self._drawn_height = canvas_height
+        
+        # Rows outside the visible part of the canvas are skipped
+        view_top = self.canvas.canvasy(0)
+        view_bottom = view_top + canvas_height
+        
+        # Nothing to do if none of the data this mode draws has changed
+        versions = self.memory_manager.mode_versions
+        view_key = (mode, zoom, canvas_height, view_top) + tuple(
+            versions[dependency] for dependency in MODE_DEPENDENCIES[mode]
+        )
+        if view_key == self._last_view_key:
+            return
+        self._last_view_key = view_key
+        
+        # Changes may still be invisible, e.g. a replacement policy switch
+        sig = self._visual_signature(mode, zoom, canvas_height) + (view_top,)
+        if sig == self._last_vis_sig:
+            return
+        self._last_vis_sig = sig
         
         # Calculate scaled dimensions
         scaled_width = BLOCK_WIDTH * zoom
         scaled_height = BLOCK_HEIGHT * zoom
+        process_color = self.memory_manager.get_process_color
         
-        # Draw grid lines
-        for i in range(0, MEMORY_SIZE + 1, 10):
-            x = 10 + i * scaled_width
-            self.canvas.create_line(x, 0, x, self.canvas.winfo_height(), fill="lightgray")
+        self._draw_grid(scaled_width, canvas_height)
+        right = 10 + MEMORY_SIZE * scaled_width  # Rightmost drawn x, for the scroll region
         
-        mode = self.mode_var.get()
+        # Hover lookup tables are rebuilt below for the dynamic layout only
+        self._hover_blocks = []
+        self._block_y_offsets = array("d")
+        self._block_x_ends = array("d")
+        self._hover_height = scaled_height
+        self._last_hover_idx = None
         
         if mode == "dynamic":
             # Draw memory blocks for dynamic allocation
-            for block in self.memory_manager.memory:
+            self._hover_blocks = list(self.memory_manager.memory)
+            for block in self._hover_blocks:
                 # Determine block color and text
                 if block.status == "free":
                     color = "light green"
-                    text = f"Free\n{block.size} units"
                 else:
-                    color = self.memory_manager.get_process_color(block.process_id)
-                    text = f"{block.process_id}\n{block.size} units"
+                    color = process_color(block.process_id)
+                text = block_label(block.status, block.process_id, block.size)
                 
                 # Draw the block with scaled dimensions
                 x1, y1 = 10, y
                 x2, y2 = 10 + block.size * scaled_width, y + scaled_height
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
+                self._block_y_offsets.append(y1)
+                self._block_x_ends.append(x2)
+                right = max(right, x2)
+                y += scaled_height + 5
+                if y2 < view_top or y1 > view_bottom:
+                    continue
+                
+                key = ("block", block.start)
+                self._place_item("rect", key, (x1, y1, x2, y2), fill=color)
                 
                 # Add block information
-                self.canvas.create_text(
-                    (x1 + x2) / 2, 
-                    (y1 + y2) / 2, 
-                    text=text,
-                    justify="center"
-                )
+                self._place_item("text", key, ((x1 + x2) / 2, (y1 + y2) / 2), text=text)
                 
                 # Add start address
-                self.canvas.create_text(
-                    x1 + 5,
-                    y1 + 5,
-                    text=f"{block.start}",
-                    anchor="nw",
-                    font=('Helvetica', 8)
-                )
-                
-                y += scaled_height + 5
+                self._place_item("label", key, (x1 + 5, y1 + 5), text=f"{block.start}")
                 
         elif mode == "paging":
-            # Draw physical memory frames
-            frame_width = MEMORY_SIZE // self.memory_manager.max_pages
-            for i in range(self.memory_manager.max_pages):
-                x1 = 10 + i * frame_width * scaled_width
-                x2 = x1 + frame_width * scaled_width
-                y1 = y
-                y2 = y + scaled_height
-                
-                # Draw frame
-                frame = self.memory_manager.frame_table.get(i)
-                if frame:
-                    color = self.memory_manager.get_process_color(frame.process_id)
-                    text = f"P{frame.process_id} P{frame.page_number}"
+            # Draw physical memory frames; only their fill and text vary between redraws
+            place = self._place_item
+            layout = self._frame_layout(scaled_width, scaled_height)
+            for (key, rect, text_pos, label_pos, label), frame in zip(layout, self.memory_manager.frame_table):
+                if frame is not None:
+                    color = process_color(frame.process_id)
+                    text = frame_label(frame.process_id, frame.page_number)
                 else:
                     color = "light green"
                     text = "Free"
                 
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
-                self.canvas.create_text(
-                    (x1 + x2) / 2,
-                    (y1 + y2) / 2,
-                    text=text,
-                    justify="center"
-                )
+                place("rect", key, rect, fill=color)
+                place("text", key, text_pos, text=text)
                 
                 # Add frame number
-                self.canvas.create_text(
-                    x1 + 5,
-                    y1 + 5,
-                    text=f"Frame {i}",
-                    anchor="nw",
-                    font=('Helvetica', 8)
-                )
+                place("label", key, label_pos, text=label)
             
             y += scaled_height + 5
             
@@ -1588,92 +2134,67 @@ class MemoryVisualizer:
                 y2 = y1 + scaled_height
                 
                 # Draw process header
-                color = self.memory_manager.get_process_color(process_id)
-                self.canvas.create_rectangle(x1, y1, x1 + 200, y2, fill=color)
-                self.canvas.create_text(
-                    x1 + 100,
-                    (y1 + y2) / 2,
-                    text=f"Process {process_id} Page Table",
-                    justify="center"
-                )
-                
-                y += scaled_height + 5
-                
-                # Draw page entries
-                for i, page in enumerate(pages):
-                    x1 = 10 + i * 100
-                    x2 = x1 + 90
-                    y1 = y
-                    y2 = y1 + scaled_height
-                    
-                    # Draw page entry
-                    if page.is_valid:
-                        color = "light blue"
-                        text = f"Page {page.page_number}\nFrame {page.frame_number}"
-                    else:
-                        color = "pink"
-                        text = f"Page {page.page_number}\nNot in Memory"
-                    
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
-                    self.canvas.create_text(
-                        (x1 + x2) / 2,
-                        (y1 + y2) / 2,
-                        text=text,
-                        justify="center"
-                    )
+                if view_top <= y2 and y1 <= view_bottom:
+                    color = process_color(process_id)
+                    key = ("table", process_id)
+                    self._place_item("rect", key, (x1, y1, x1 + 200, y2), fill=color)
+                    self._place_item("text", key, (x1 + 100, (y1 + y2) / 2), text=f"Process {pid_str(process_id)} Page Table")
                 
                 y += scaled_height + 5
                 
-        elif mode == "segmentation":
-            # Draw segments
-            for segment in self.memory_manager.segments:
-                x1 = 10
-                x2 = 10 + segment.size * scaled_width
+                # Draw page entries; column geometry is fixed, only the row varies
                 y1 = y
-                y2 = y + scaled_height
-                
-                # Draw segment
-                color = self.memory_manager.get_process_color(segment.process_id)
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
-                
-                # Add segment information
-                text = f"Segment: {segment.name}\nProcess: {segment.process_id}\nSize: {segment.size}"
-                self.canvas.create_text(
-                    (x1 + x2) / 2,
-                    (y1 + y2) / 2,
-                    text=text,
-                    justify="center"
-                )
+                y2 = y1 + scaled_height
+                columns = self._page_columns(len(pages))
+                if pages:
+                    right = max(right, columns[len(pages) - 1][1])
+                if view_top <= y2 and y1 <= view_bottom:
+                    text_y = (y1 + y2) / 2
+                    for i, page in enumerate(pages):
+                        x1, x2, text_x = columns[i]
+                        color, text = page_entry_style(page)
+                        key = ("page", process_id, i)
+                        self._place_item("rect", key, (x1, y1, x2, y2), fill=color)
+                        self._place_item("text", key, (text_x, text_y), text=text)
                 
                 y += scaled_height + 5
                 
-                # Draw pages in segment
-                for page in segment.pages:
-                    x1 = 10
-                    x2 = 10 + page.size * scaled_width
-                    y1 = y
-                    y2 = y + scaled_height
-                    
+        elif mode == "segmentation":
+            # Segment geometry only changes with the segments themselves; page
+            # residency can change any time, so colors and text stay live
+            y1s, y2s, rows, segments_right, y = self._segment_layout(scaled_width, scaled_height)
+            right = max(right, segments_right)
+            
+            # Rows are laid out top to bottom, so the visible ones form a slice
+            first = bisect_left(y2s, view_top)
+            last = bisect_right(y1s, view_bottom)
+            for i in range(first, last):
+                x2, key, segment, page = rows[i]
+                y1, y2 = y1s[i], y2s[i]
+                if page is None:
+                    # Draw segment
+                    color = process_color(segment.process_id)
+                    text = segment_label(segment.name, segment.process_id, segment.size)
+                else:
                     # Draw page
-                    if page.is_valid:
-                        color = "light blue"
-                        text = f"Page {page.page_number}\nFrame {page.frame_number}"
-                    else:
-                        color = "pink"
-                        text = f"Page {page.page_number}\nNot in Memory"
-                    
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
-                    self.canvas.create_text(
-                        (x1 + x2) / 2,
-                        (y1 + y2) / 2,
-                        text=text,
-                        justify="center"
-                    )
-                    
-                    y += scaled_height + 5
-        
-        # Update canvas scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+                    color, text = page_entry_style(page)
+                self._place_item("rect", key, (10, y1, x2, y2), fill=color)
+                self._place_item("text", key, ((10 + x2) / 2, (y1 + y2) / 2), text=text)
+        
+        self._trim_items()
+        
+        # Update canvas scroll region from the full layout, since rows
+        # outside the view have no items for bbox to measure
+        scrollregion = (0, 0, right + 10, max(y, canvas_height))
+        if scrollregion != self._last_scrollregion:
+            self.canvas.configure(scrollregion=scrollregion)
+            self._last_scrollregion = scrollregion
+            
+            # A smaller region makes Tk confine the view, which can scroll rows
+            # culled above into view; draw again for where the view ended up
+            if self.canvas.canvasy(0) != view_top:
+                self.update_visualization()
+                return
         
         # Update process list
         self.update_process_list()
@@ -1681,7 +2202,7 @@ class MemoryVisualizer:
     def on_block_select(self, event):
         """Handle block selection in process list"""
         item = self.process_tree.selection()[0]
-        values = self.process_tree.item(item)["values"]
+        values = self._tree_values.get(item) or self.process_tree.item(item)["values"]
         process_id = values[0]
         block_id = values[1]
         